@@ -0,0 +1,13 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    # Optionally compile the communication hot path (attribute lookups,
+    # command formatting) to a C extension. The pure python module stays
+    # the fallback whenever Cython is not installed or the build fails.
+    ext_modules = cythonize(['src/lecroyutils/control.py'], language_level=3, exclude_failures=True)
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -1,18 +1,42 @@
-import re
+import functools
+import os
+import socket
+from contextlib import contextmanager
 from enum import Enum
-from typing import AnyStr, Dict, Union
-
-import vxi11
+from typing import AnyStr, Dict, List, Optional, Union
 
 from .data import LecroyScopeData
 
 VBSValue = Union[str, int, float]
 
+# Record separator used to split the values of batched VBS queries.
+_VBS_SEP = '\x1e'
+# VBS expression joining two query values with the record separator.
+_VBS_SEP_EXPR = f' & "{_VBS_SEP}" & '
+
+# Pre-encoded VBS query fragments, joined into a single on-wire buffer per query.
+_VBS_QUERY_PREFIX = b"VBS? 'return = "
+_VBS_QUERY_SUFFIX = b"'"
+
+
+# type -> formatter dispatch, avoiding an isinstance chain per argument
+_ESCAPE = {
+    str: '"{}"'.format,
+    int: str,
+    float: repr,
+    bool: lambda value: '-1' if value else '0',
+}
+
 
 def _escape(value: VBSValue) -> str:
-    if isinstance(value, str):
-        return f'"{value}"'
-    return repr(value)
+    return _ESCAPE.get(type(value), repr)(value)
+
+
+def _drop_page_cache(file_obj):
+    # One-shot captures should not evict more useful data from the page cache.
+    if hasattr(os, 'posix_fadvise'):
+        file_obj.flush()
+        os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
 
 def _unpack_response(res: str) -> str:
@@ -21,6 +45,21 @@ def _unpack_response(res: str) -> str:
     return res
 
 
+class LecroyValidationError(ValueError):
+    """
+    The provided value is not accepted by the oscilloscope setting.
+    """
+    pass
+
+
+class LecroyChannelError(LookupError):
+    """
+    The requested channel or parameter is not available on the connected
+    oscilloscope.
+    """
+    pass
+
+
 class TriggerMode(Enum):
     stopped = 'Stopped'
     single = 'Single'
@@ -39,11 +78,75 @@ class TriggerType(Enum):
 
 
 class LecroyComm:
+    # format methods bound once at class load instead of per-call f-strings
+    _ACTION_FMT = "VBS '{}'".format
+    _SET_FMT = "VBS '{} = {}'".format
+    _SET_QUERY_FMT = "VBS? '{} = {} : return = {}'".format
+    _STMT_FMT = '{} = {}'.format
+    _CALL_FMT = '{}({})'.format
+
     def __init__(self, ip: str):
+        # Deferred so that importing the module (e.g. just for the enums)
+        # does not pull in the vxi11 rpc machinery.
+        global vxi11
+        import vxi11
+
         self.scope = vxi11.Instrument(ip)
+        self._batch_buffer: Optional[List[str]] = None
+        self._rxbuf = bytearray()
+
+        # Open the link once and keep it for the whole session. Disabling
+        # Nagle lets the small SCPI/VBS commands hit the wire immediately
+        # instead of waiting for an ACK to coalesce them.
+        self.scope.open()
+        sock = self.scope.client.sock
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers all VBS writes inside the block and sends them as one
+        combined statement on exit, collapsing n round-trips into one.
+
+        Queries inside the block flush the pending writes first, so the
+        block is most effective when it only sets values. On an exception
+        the pending writes are discarded. Nested blocks join the outermost
+        batch, which flushes everything once on exit.
+        """
+        if self._batch_buffer is not None:
+            yield self
+            return
+
+        self._batch_buffer = []
+        try:
+            yield self
+            self._flush()
+        finally:
+            self._batch_buffer = None
+
+    def _flush(self):
+        if self._batch_buffer:
+            statements, self._batch_buffer = self._batch_buffer, []
+            self.scope.write(self._ACTION_FMT(' : '.join(statements)))
+
+    def _ask(self, expression: str) -> str:
+        """
+        Queries the given VBS expression with a fused write/read.
+
+        The command is assembled as a single bytes object from pre-encoded
+        fragments, so it goes out in one send instead of several.
+        """
+        if self._batch_buffer:
+            self._flush()
+        command = b''.join((_VBS_QUERY_PREFIX, expression.encode('ascii'), _VBS_QUERY_SUFFIX))
+        return _unpack_response(self.scope.ask_raw(command).decode('ascii').rstrip('\r\n'))
 
     def action(self, action: str):
-        self.scope.write(f'VBS \'{action}\'')
+        if self._batch_buffer is not None:
+            self._batch_buffer.append(action)
+            return
+        self.scope.write(self._ACTION_FMT(action))
 
     def method(self, method: str, *args: VBSValue, timeout: float = None) -> str:
         old_timeout = self.scope.timeout
@@ -51,23 +154,107 @@ class LecroyComm:
             self.scope.timeout = timeout + old_timeout
 
         arg_string = ', '.join(map(_escape, args))
-        self.scope.write(f'VBS? \'return = {method}({arg_string})\'')
-        response = _unpack_response(self.scope.read())
+        response = self._ask(self._CALL_FMT(method, arg_string))
 
         self.scope.timeout = old_timeout
         return response
 
     def set(self, var: str, value: VBSValue):
-        self.scope.write(f'VBS \'{var} = {_escape(value)}\'')
+        if self._batch_buffer is not None:
+            self._batch_buffer.append(self._STMT_FMT(var, _escape(value)))
+            return
+        self.scope.write(self._SET_FMT(var, _escape(value)))
 
     def read(self, var: str) -> str:
-        self.scope.write(f'VBS? \'return = {var}\'')
-        return _unpack_response(self.scope.read())
+        return self._ask(var)
+
+    def read_and_set(self, var: str, value: VBSValue) -> str:
+        """
+        Sets a VBS variable and reads the resulting value back in a single
+        round-trip, so a verify-after-set costs one round-trip instead of two.
+        """
+        if self._batch_buffer:
+            self._flush()
+        return _unpack_response(self.scope.ask(self._SET_QUERY_FMT(var, _escape(value), var)))
+
+    def read_many(self, variables: List[str]) -> List[str]:
+        """
+        Reads multiple VBS variables in a single round-trip.
+
+        The variables are concatenated into one VBS query on the scope side,
+        so one network round-trip replaces one per variable.
+        """
+        return self._ask(_VBS_SEP_EXPR.join(variables)).split(_VBS_SEP)
+
+    def read_raw_fast(self) -> bytes:
+        """
+        Reads a raw (binary) response into a receive buffer that is reused
+        across calls, so repeated large transfers do not regrow a fresh
+        buffer every time. Only the final immutable copy is allocated.
+        """
+        scope = self.scope
+        if scope.link is None:
+            scope.open()
+
+        buffer = self._rxbuf
+        del buffer[:]  # keeps the capacity from previous transfers
+        reason = 0
+        while reason & vxi11.vxi11.RX_END == 0:
+            error, reason, data = scope.client.device_read(
+                scope.link,
+                scope.max_recv_size,
+                scope._timeout_ms,
+                scope._lock_timeout_ms,
+                0,
+                0
+            )
+            if error:
+                raise vxi11.vxi11.Vxi11Exception(error, 'read')
+            buffer.extend(data)
+        return bytes(buffer)
+
+    def read_raw_to(self, file_obj, chunksize: int = 1 << 20):
+        """
+        Reads a raw (binary) response chunk by chunk and writes each chunk
+        directly to the given file object.
+
+        Avoids buffering multi-MB transfers (waveforms, screenshots) in
+        memory before they reach the disk.
+        """
+        scope = self.scope
+        if scope.link is None:
+            scope.open()
+
+        write = file_obj.write
+        reason = 0
+        while reason & vxi11.vxi11.RX_END == 0:
+            error, reason, data = scope.client.device_read(
+                scope.link,
+                min(chunksize, scope.max_recv_size),
+                scope._timeout_ms,
+                scope._lock_timeout_ms,
+                0,
+                0
+            )
+            if error:
+                raise vxi11.vxi11.Vxi11Exception(error, 'read')
+            write(data)
 
     def wait_opc(self):
-        self.scope.write("*OPC?")
-        opc = self.scope.read()
-        assert opc == '1' or '*OPC 1'
+        if self._batch_buffer:
+            self._flush()
+        opc = self.scope.ask('*OPC?').strip()
+        assert opc.endswith('1'), opc
+
+    def action_sync(self, action: str):
+        """
+        Performs the given VBS action and waits for completion in a single
+        round-trip by chaining *OPC? onto the command.
+        """
+        if self._batch_buffer:
+            self._flush()
+        opc = self.scope.ask(self._ACTION_FMT(action) + ';*OPC?').strip()
+        assert opc.endswith('1'), opc
 
 
 class LecroyChannel:
@@ -81,9 +268,15 @@ class LecroyChannel:
         self.name = source.upper()
         self.comm = comm
 
+        # VBS paths built once instead of concatenated on every access
+        self._p_coupling = f'app.acquisition.{self.name}.Coupling'
+        self._p_ver_offset = f'app.acquisition.{self.name}.VerOffset'
+        self._p_ver_scale = f'app.acquisition.{self.name}.VerScale'
+        self._p_view = f'app.acquisition.{self.name}.view'
+
     @property
     def coupling(self) -> str:
-        return self.comm.read('app.acquisition.' + self.name + '.Coupling')
+        return self.comm.read(self._p_coupling)
 
     @coupling.setter
     def coupling(self, coupling: str = 'DC50'):
@@ -93,16 +286,17 @@ class LecroyChannel:
             coupling (str, optional): Coupling is typically 'DC50', 'DC1M', 'AC1M', 'GND','DC100k'. Defaults to 'DC50'.
 
         Raises:
-            Exception: on invalid Coupling
+            LecroyValidationError: on invalid Coupling
         """
-        if coupling.upper() not in ['DC50', 'DC1M', 'AC1M', 'GND', 'DC100k']:
-            raise Exception(f'Invalid Coupling: {coupling}')
+        coupling = coupling.upper()
+        if coupling not in ['DC50', 'DC1M', 'AC1M', 'GND', 'DC100K']:
+            raise LecroyValidationError(f'Invalid Coupling: {coupling}')
 
-        self.comm.action('app.acquisition.' + self.name + '.Coupling = "' + coupling.upper() + '"')
+        self.comm.action(self._p_coupling + ' = "' + coupling + '"')
 
     @property
     def vertical_offset(self) -> float:
-        return float(self.comm.read('app.acquisition.' + self.name + '.VerOffset'))
+        return float(self.comm.read(self._p_ver_offset))
 
     @vertical_offset.setter
     def vertical_offset(self, offset: float = 0.0):
@@ -112,7 +306,7 @@ class LecroyChannel:
             offset (float, optional): Vertical offset. Defaults to 0.0.
 
         """
-        self.comm.action('app.acquisition.' + self.name + '.VerOffset = ' + str(offset))
+        self.comm.action(self._p_ver_offset + ' = ' + str(offset))
 
     @property
     def vertical_scale(self) -> float:
@@ -124,7 +318,7 @@ class LecroyChannel:
         Returns:
             float: Vertical scale value
         """
-        return float(self.comm.read('app.acquisition.' + self.name + '.VerScale'))
+        return float(self.comm.read(self._p_ver_scale))
 
     @vertical_scale.setter
     def vertical_scale(self, ver_scale: float = 0.001):
@@ -133,7 +327,7 @@ class LecroyChannel:
         Args:
             ver_scale (float, optional): vertical scale. Defaults to 0.001.
         """
-        self.comm.action('app.Acquisition.' + self.name + '.VerScale = ' + str(ver_scale))
+        self.comm.action(self._p_ver_scale + ' = ' + str(ver_scale))
 
     def set_view(self, view: bool = True):
         """Set view on or off
@@ -146,7 +340,31 @@ class LecroyChannel:
         Raises:
             ParametersError: on invalid source or group
         """
-        self.comm.action('app.acquisition.' + self.name.upper() + '.view = ' + str(view))
+        self.comm.action(self._p_view + ' = ' + str(view))
+
+
+@functools.lru_cache(maxsize=None)
+def _specialize_channel(name: str):
+    """
+    Creates a `LecroyChannel` subclass specialized for the given channel
+    name, with the VBS paths baked into the property getters as closure
+    constants. Channel identity is fixed once a scope is connected, so the
+    one-time class creation buys zero path lookups per access afterwards.
+    """
+    p_coupling = f'app.acquisition.{name}.Coupling'
+    p_ver_offset = f'app.acquisition.{name}.VerOffset'
+    p_ver_scale = f'app.acquisition.{name}.VerScale'
+
+    # .getter() keeps the validating setters of the base property
+    namespace = {
+        'coupling': LecroyChannel.coupling.getter(
+            lambda self: self.comm.read(p_coupling)),
+        'vertical_offset': LecroyChannel.vertical_offset.getter(
+            lambda self: float(self.comm.read(p_ver_offset))),
+        'vertical_scale': LecroyChannel.vertical_scale.getter(
+            lambda self: float(self.comm.read(p_ver_scale))),
+    }
+    return type(f'LecroyChannel_{name}', (LecroyChannel,), namespace)
 
 
 class LecroyScope:
@@ -167,29 +385,50 @@ class LecroyScope:
 
         self._comm = LecroyComm(ip)
         self._parse_available_resources()
-        self.chan: dict[str, LecroyChannel] = {v: LecroyChannel(self._comm, v) for v in self.available_channels}
+        self.chan: dict[str, LecroyChannel] = {
+            v: _specialize_channel(v)(self._comm, v) for v in self.available_channels
+        }
 
     def is_idle(self) -> str:
         return self._comm.method('app.WaitUntilIdle', 5)
 
+    def batch(self):
+        """
+        Context manager deferring all setter writes inside the block into
+        one combined VBS statement sent on exit, e.g.::
+
+            with scope.batch():
+                scope.trigger_mode = TriggerMode.single
+                scope.horizontal_scale = 1e-6
+
+        Reading a property inside the block flushes the pending writes
+        first, so write-only blocks batch best.
+        """
+        return self._comm.batch()
+
     def _parse_available_resources(self):
-        for resource in self._comm.read('app.ExecsNameAll').split(','):
-            if re.match(r"C\d.*", resource):
-                self.available_channels.append(resource)
-            elif re.match(r"P\d.*", resource):
-                self.available_parameters.append(resource)
+        resources = self._comm.read('app.ExecsNameAll').split(',')
+        self.available_channels = [r for r in resources if r[:1] == 'C' and r[1:2].isdigit()]
+        self.available_parameters = [r for r in resources if r[:1] == 'P' and r[1:2].isdigit()]
+
+        # frozensets for O(1) membership tests in the validation paths
+        self._channels_upper = frozenset(c.upper() for c in self.available_channels)
+        self._parameters_upper = frozenset(p.upper() for p in self.available_parameters)
+        # sources accepted as trigger source resp. carrying per-source trigger fields
+        self._trigger_sources_upper = self._channels_upper | {'EXT', 'LINE'}
+        self._ext_sources_upper = self._channels_upper | {'EXT'}
 
     def check_source(self, source: str):
         # currently no digital channels supported
         self.check_channel(source)
 
     def check_channel(self, channel: str):
-        if channel.upper() not in self.available_channels:
-            raise Exception(f'Channel {channel} not available.')
+        if channel.upper() not in self._channels_upper:
+            raise LecroyChannelError(f'Channel {channel} not available.')
 
     def check_parameter(self, parameter: str):
-        if parameter.upper() not in self.available_parameters:
-            raise Exception(f'Parameter {parameter} not available.')
+        if parameter.upper() not in self._parameters_upper:
+            raise LecroyChannelError(f'Parameter {parameter} not available.')
 
     def acquire(self, timeout: float = 0.1, force=False) -> bool:
         return self._comm.method('app.Acquisition.acquire', timeout, force, timeout=timeout) == '1'
@@ -208,9 +447,10 @@ class LecroyScope:
 
     @trigger_source.setter
     def trigger_source(self, source: str):
-        if source.upper() not in ['EXT', 'LINE']:
-            self.check_source(source)
-        self._comm.set('app.Acquisition.Trigger.Source', source.upper())
+        source = source.upper()
+        if source not in self._trigger_sources_upper:
+            raise LecroyChannelError(f'Channel {source} not available.')
+        self._comm.set('app.Acquisition.Trigger.Source', source)
 
     @property
     def trigger_type(self) -> TriggerType:
@@ -220,14 +460,26 @@ class LecroyScope:
     def trigger_type(self, new_type: TriggerType):
         self._comm.set('app.Acquisition.Trigger.Type', new_type.value)
 
+    def _read_trigger_source_field(self, field: str) -> List[str]:
+        # The second expression is evaluated on the scope itself, so the
+        # source and the source dependent field come back in one round-trip.
+        values = self._comm.read_many([
+            'app.Acquisition.Trigger.Source',
+            f'Eval("app.Acquisition.Trigger." & app.Acquisition.Trigger.Source & ".{field}")'
+        ])
+        if len(values) < 2:
+            # the Eval failed, e.g. for sources without per-source fields (LINE)
+            raise LecroyChannelError(f'Invalid channel: {values[0]}')
+        return values
+
     @property
     def trigger_level(self) -> str:
-        return self._comm.read(f'app.Acquisition.Trigger.{self.trigger_source}.Level')
+        return self._read_trigger_source_field('Level')[1]
 
     @trigger_level.setter
     def trigger_level(self, level: VBSValue):
         source = self.trigger_source
-        if source.upper() not in ['EXT', *self.available_channels]:
+        if source.upper() not in self._ext_sources_upper:
             raise NotImplementedError(f'Setting of trigger_level not supported for current trigger_source ({source}).')
 
         self._comm.set(f'app.Acquisition.Trigger.{source}.Level', level)
@@ -237,37 +489,50 @@ class LecroyScope:
 
     def statistics(self, parameter: str) -> Dict[str, str]:
         self.check_parameter(parameter)
-        return {
-            'last': self._comm.read(f'app.Measure.{parameter}.last.Result.Value'),
-            'max': self._comm.read(f'app.Measure.{parameter}.max.Result.Value'),
-            'mean': self._comm.read(f'app.Measure.{parameter}.mean.Result.Value'),
-            'min': self._comm.read(f'app.Measure.{parameter}.min.Result.Value'),
-            'num': self._comm.read(f'app.Measure.{parameter}.num.Result.Value'),
-            'sdev': self._comm.read(f'app.Measure.{parameter}.sdev.Result.Value'),
-            'status': self._comm.read(f'app.Measure.{parameter}.Out.Result.Status')
-        }
-
-    def _screenshot_raw(self) -> bytes:
+        values = self._comm.read_many([
+            f'app.Measure.{parameter}.last.Result.Value',
+            f'app.Measure.{parameter}.max.Result.Value',
+            f'app.Measure.{parameter}.mean.Result.Value',
+            f'app.Measure.{parameter}.min.Result.Value',
+            f'app.Measure.{parameter}.num.Result.Value',
+            f'app.Measure.{parameter}.sdev.Result.Value',
+            f'app.Measure.{parameter}.Out.Result.Status'
+        ])
+        return dict(zip(['last', 'max', 'mean', 'min', 'num', 'sdev', 'status'], values))
+
+    def _request_screenshot(self):
         self._comm.scope.write(
             "HCSU DEV, PNG, FORMAT, PORTRAIT, BCKG, WHITE, DEST, REMOTE, PORT, NET, AREA, GRIDAREAONLY")
         self._comm.scope.write("SCDP")
-        return self._comm.scope.read_raw()
+
+    def _screenshot_raw(self) -> bytes:
+        self._request_screenshot()
+        return self._comm.read_raw_fast()
 
     def save_screenshot(self, file_path: AnyStr):
+        # open first, so a failed open does not leave an unread response
+        # queued on the instrument
         with open(file_path, 'wb') as f:
-            f.write(self._screenshot_raw())
+            self._request_screenshot()
+            self._comm.read_raw_to(f)
+            _drop_page_cache(f)
 
-    def _waveform_raw(self, source: str) -> bytes:
+    def _request_waveform(self, source: str):
         self.check_source(source)
         self._comm.scope.write(f'{source}:WF?')
-        return self._comm.scope.read_raw()
+
+    def _waveform_raw(self, source: str) -> bytes:
+        self._request_waveform(source)
+        return self._comm.read_raw_fast()
 
     def waveform(self, source: str) -> LecroyScopeData:
         return LecroyScopeData(self._waveform_raw(source), source_desc=f'{source}-live')
 
     def save_waveform(self, source: str, file_path: AnyStr):
         with open(file_path, 'wb') as f:
-            f.write(self._waveform_raw(source))
+            self._request_waveform(source)
+            self._comm.read_raw_to(f)
+            _drop_page_cache(f)
 
     def save_waveform_on_lecroy(self):
         self._comm.action('app.SaveRecall.Waveform.SaveFile')
@@ -277,15 +542,14 @@ class LecroyScope:
     def recall_default_panel(self):
         """Recall the default setup of the DSO
         """
-        self._comm.action('app.SaveRecall.Setup.DoRecallDefaultPanel')
-        self._comm.wait_opc()
+        self._comm.action_sync('app.SaveRecall.Setup.DoRecallDefaultPanel')
 
     def force_trigger(self):
         """Forces a trigger on the instrument
         """
         self._comm.scope.write('FRTR')
 
-    @property
+    @functools.cached_property
     def serial_number(self) -> str:
         """Get the serial number of the DSO
 
@@ -294,7 +558,7 @@ class LecroyScope:
         """
         return self._comm.read('app.SerialNumber')
 
-    @property
+    @functools.cached_property
     def instrument_model(self) -> str:
         """Gets the instrument model of the DSO
 
@@ -303,7 +567,7 @@ class LecroyScope:
         """
         return self._comm.read('app.InstrumentModel')
 
-    @property
+    @functools.cached_property
     def firmware_version(self) -> str:
         """Gets the firmware version of the DSO
 
@@ -367,12 +631,12 @@ class LecroyScope:
             sample_rate (float): sample rate value
 
         Raises:
-            Exception: on invalid Sample rate
+            LecroyValidationError: on invalid Sample rate
         """
         self.memory_mode = 'FIXEDSAMPLERATE'
-        self._comm.set('app.Acquisition.Horizontal.samplerate', sample_rate)
-        if self.sample_rate != float(sample_rate):
-            raise Exception(f'Invalid Sample Rate: {sample_rate}')
+        actual_rate = self._comm.read_and_set('app.Acquisition.Horizontal.samplerate', sample_rate)
+        if float(actual_rate) != float(sample_rate):
+            raise LecroyValidationError(f'Invalid Sample Rate: {sample_rate}')
 
     @property
     def memory_mode(self) -> str:
@@ -391,21 +655,22 @@ class LecroyScope:
             maximize (str, optional): Possible values are SETMAXIMUMMEMORY|FIXEDSAMPLERATE. Defaults to 'SetMaximumMemory'.
 
         Raises:
-            ParametersError: on invalid Memory mode
+            LecroyValidationError: on invalid Memory mode
         """
-        if maximize.upper() not in ['SETMAXIMUMMEMORY', 'FIXEDSAMPLERATE']:
-            raise Exception(f'Invalid Memory mode: {maximize}')
+        maximize = maximize.upper()
+        if maximize not in ['SETMAXIMUMMEMORY', 'FIXEDSAMPLERATE']:
+            raise LecroyValidationError(f'Invalid Memory mode: {maximize}')
 
-        self._comm.set('app.Acquisition.Horizontal.maximize', maximize.upper())
+        self._comm.set('app.Acquisition.Horizontal.maximize', maximize)
 
     @property
     def trigger_coupling(self) -> str:
-        source = self.trigger_source
+        source, coupling = self._read_trigger_source_field('Coupling')
 
-        if source.upper() not in ['EXT', *self.available_channels]:
-            raise Exception(f'Invalid channel: {source}')
+        if source.upper() not in self._ext_sources_upper:
+            raise LecroyChannelError(f'Invalid channel: {source}')
 
-        return self._comm.read(f'app.Acquisition.Trigger.{source.upper()}.Coupling')
+        return coupling
 
     @trigger_coupling.setter
     def trigger_coupling(self, coupling: str):
@@ -415,26 +680,27 @@ class LecroyScope:
             coupling (str): Sets the coupling.
 
         Raises:
-            Exception: Invalid channel or coupling
+            LecroyChannelError or LecroyValidationError: Invalid channel or coupling
         """
-        source = self.trigger_source
+        source = self.trigger_source.upper()
 
-        if source.upper() not in ['EXT', *self.available_channels]:
-            raise Exception(f'Invalid channel: {source}')
+        if source not in self._ext_sources_upper:
+            raise LecroyChannelError(f'Invalid channel: {source}')
 
-        if coupling.upper() not in ('DC', 'AC', 'LFREJ', 'HFREJ'):
-            raise Exception(f'Trigger Coupling not valid: {coupling}')
+        coupling = coupling.upper()
+        if coupling not in ('DC', 'AC', 'LFREJ', 'HFREJ'):
+            raise LecroyValidationError(f'Trigger Coupling not valid: {coupling}')
 
-        self._comm.action('app.Acquisition.Trigger.' + source.upper() + '.Coupling = "' + coupling.upper() + '"')
+        self._comm.action('app.Acquisition.Trigger.' + source + '.Coupling = "' + coupling + '"')
 
     @property
     def trigger_impedance(self) -> str:
-        source = self.trigger_source
+        source, impedance = self._read_trigger_source_field('InputImpedance')
 
-        if source.upper() not in ['EXT', *self.available_channels]:
-            raise Exception(f'Invalid channel: {source}')
+        if source.upper() not in self._ext_sources_upper:
+            raise LecroyChannelError(f'Invalid channel: {source}')
 
-        return self._comm.read(f'app.Acquisition.Trigger.{source.upper()}.InputImpedance')
+        return impedance
 
     @property
     def ext_coupling(self) -> str:
@@ -448,12 +714,13 @@ class LecroyScope:
             coupling (str): Sets the coupling.
 
         Raises:
-            Exception: Invalid channel or coupling
+            LecroyChannelError or LecroyValidationError: Invalid channel or coupling
         """
-        if coupling.upper() not in ('DC50', 'DC1M'):
-            raise Exception(f'Trigger Coupling not valid: {coupling}')
+        coupling = coupling.upper()
+        if coupling not in ('DC50', 'DC1M'):
+            raise LecroyValidationError(f'Trigger Coupling not valid: {coupling}')
 
-        self._comm.action('app.Acquisition.Horizontal.ExtCoupling = "' + coupling.upper() + '"')
+        self._comm.action('app.Acquisition.Horizontal.ExtCoupling = "' + coupling + '"')
 
     @property
     def max_samples(self):